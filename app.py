@@ -1,7 +1,9 @@
+import os
 import re
 import hashlib
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from datetime import timezone
+from datetime import datetime, timezone
 
 import pandas as pd
 import requests
@@ -10,6 +12,11 @@ import yaml
 from bs4 import BeautifulSoup
 from dateutil import parser as dateparser
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml 없는 환경은 순수 파이썬 로더
+    from yaml import SafeLoader as YamlLoader
+
 
 # ============================
 # SETTINGS
@@ -34,9 +41,16 @@ MAX_DETAIL_PER_SOURCE = 40
 # ============================
 # LOAD CONFIG
 # ============================
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_config_cached(path: str, mtime: float):
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def load_config():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # 프로세스당 1회만 파싱 (rerun마다 재파싱 X), config.yaml 수정 시 mtime으로 재로드
+    # cache_data: 호출마다 사본을 돌려주므로 세션 간 설정 객체 공유 없음
+    return _load_config_cached(CONFIG_PATH, os.path.getmtime(CONFIG_PATH))
 
 
 cfg = load_config()
@@ -53,18 +67,47 @@ _punct = re.compile(r"[^0-9A-Za-z가-힣 ]+")
 _digits = re.compile(r"\b\d+(?:[.,]\d+)*\b")
 
 
+@lru_cache(maxsize=4096)
 def norm_text(s: str) -> str:
-    return _ws.sub(" ", (s or "").strip())
+    s = (s or "").strip()
+    # 대부분의 제목/URL은 이미 깨끗함: 공백 연속·탭/개행·특수 공백이 없으면 정규식 생략
+    # (ASCII 공백 외의 \s 문자는 모두 isprintable()이 False)
+    if s.isprintable() and "  " not in s:
+        return s
+    return _ws.sub(" ", s)
+
+
+# 흔한 형식은 strptime 으로 먼저 (dateutil 전체 파싱보다 훨씬 빠름)
+# - RSS pubDate: "Mon, 03 Feb 2026 08:00:00 GMT"
+# - 날짜만: "2026-02-03"
+FAST_DATE_FORMATS = ("%a, %d %b %Y %H:%M:%S GMT", "%Y-%m-%d")
+
+
+def _parse_date_any(s):
+    dt = dateparser.parse(s)
+    if dt and not dt.tzinfo:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(s: str):
+    # str 전용(해시 가능) -> 같은 발행일 문자열은 캐시 적중
+    for fmt in FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            pass
+    return _parse_date_any(s)
 
 
 def safe_parse_date(s: str):
     if not s:
         return None
     try:
-        dt = dateparser.parse(s)
-        if dt and not dt.tzinfo:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        if isinstance(s, str):
+            return _parse_date_str(s)
+        return _parse_date_any(s)
     except Exception:
         return None
 
@@ -82,29 +125,47 @@ def host_of(url: str) -> str:
 # STATE DETECTION (주 약어 오탐 최소화)
 # ============================
 STATE_ABBR = ["GA", "TN", "AL", "SC", "FL"]
-STATE_ABBR_RE = {abbr: re.compile(rf"(?<![A-Z0-9]){abbr}(?![A-Z0-9])") for abbr in STATE_ABBR}
+# 약어 전체를 하나의 alternation으로 (여러 개면 STATE_ABBR 순서가 우선)
+STATE_ABBR_RE = re.compile(rf"(?<![A-Z0-9])({'|'.join(STATE_ABBR)})(?![A-Z0-9])")
+STATE_ABBR_RANK = {abbr: i for i, abbr in enumerate(STATE_ABBR)}
 
 
-def detect_state_strict(text: str, source_url: str) -> str:
-    t = norm_text(text)
-    tl = t.lower()
-
-    # 1) 긴 이름 먼저
-    for code, names in (states_cfg or {}).items():
+def build_state_names(states: dict) -> tuple:
+    # 설정의 긴 이름을 한 번만 정규화/소문자화 -> (이름, 주 코드), 설정 순서 유지
+    out = []
+    for code, names in (states or {}).items():
         for n in names:
             nn = norm_text(str(n))
-            if nn.upper() in STATE_ABBR:
+            if not nn or nn.upper() in STATE_ABBR:
                 continue
-            if nn and nn.lower() in tl:
-                return code
+            out.append((nn.lower(), code))
+    return tuple(out)
+
+
+STATE_NAMES = build_state_names(states_cfg)
+
+
+@lru_cache(maxsize=4096)
+def _state_from_text(t: str):
+    # 제목(정규화된 텍스트)만으로 판별 -> 같은 제목이 다른 URL로 와도 캐시 적중
+    tl = t.lower()
+
+    # 1) 긴 이름 먼저
+    for name, code in STATE_NAMES:
+        if name in tl:
+            return code
 
     # 2) 약어는 단독 토큰만
-    for abbr, rx in STATE_ABBR_RE.items():
-        if rx.search(t):
-            return abbr
+    found = STATE_ABBR_RE.findall(t)
+    if found:
+        return min(found, key=STATE_ABBR_RANK.__getitem__)
 
+    return None
+
+
+@lru_cache(maxsize=256)
+def _state_from_host(h: str) -> str:
     # 3) 도메인 힌트
-    h = host_of(source_url)
     if "gov.georgia.gov" in h or "georgia.org" in h:
         return "GA"
     if "tnecd.com" in h:
@@ -119,6 +180,11 @@ def detect_state_strict(text: str, source_url: str) -> str:
     return "Global"
 
 
+def detect_state_strict(text: str, source_url: str) -> str:
+    t = norm_text(text)
+    return _state_from_text(t) or _state_from_host(host_of(source_url))
+
+
 # ============================
 # COMPANY DETECTION (기타 금지)
 # - 제목 + 본문에서 회사명 후보 추출